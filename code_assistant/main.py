@@ -1,9 +1,11 @@
 # main.py
 
 import asyncio
+import re
+import time
 from pathlib import Path
 from src.security import create_security_context
-from src.assistant import initialize_client, create_code_assistant
+from src.assistant import initialize_client, get_or_create_assistant
 from src.tools import file_writer
 import os
 from dotenv import load_dotenv
@@ -14,6 +16,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
+# Matches a fenced code block (```python or bare ```) in one pass
+_CODE_BLOCK_RE = re.compile(r"```(?:python)?\s*\n(.*?)```", re.DOTALL)
+
 
 class CodeAssistantApp:
     def __init__(self):
@@ -25,7 +30,7 @@ class CodeAssistantApp:
         """
         # Set up the OpenAI client and assistant
         self.client = initialize_client()
-        self.assistant_id = create_code_assistant(self.client)
+        self.assistant_id = get_or_create_assistant(self.client)
         
         # Initialize security context
         self.security = create_security_context()
@@ -33,14 +38,16 @@ class CodeAssistantApp:
         # Ensure output directory exists
         os.makedirs('output', exist_ok=True)
 
-    async def generate_code(self, description: str, filename: str) -> str:
+    async def generate_code(self, description: str, filename: str,
+                            max_wait: float = 120.0) -> str:
         """
         Generate code using the OpenAI assistant based on a description.
-        
+
         Args:
             description: What the code should do
             filename: Where to save the generated code
-            
+            max_wait: Maximum seconds to wait for the assistant run to finish
+
         Returns:
             str: Status message about the operation
         """
@@ -61,7 +68,10 @@ class CodeAssistantApp:
             assistant_id=self.assistant_id
         )
         
-        # Wait for completion
+        # Wait for completion, polling with exponential backoff so that
+        # short runs are noticed quickly without hammering the API on long ones
+        delay = 0.1
+        deadline = time.monotonic() + max_wait
         while True:
             run = self.client.beta.threads.runs.retrieve(
                 thread_id=thread.id,
@@ -71,7 +81,12 @@ class CodeAssistantApp:
                 break
             elif run.status == "failed":
                 return "Error: Assistant failed to generate code"
-            await asyncio.sleep(1)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return "Error: Timed out waiting for the assistant run"
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 2.0)
 
         # Get the assistant's response
         messages = self.client.beta.threads.messages.list(
@@ -82,21 +97,11 @@ class CodeAssistantApp:
         for msg in messages:
             if msg.role == "assistant":
                 content = msg.content[0].text.value
-                # Find the Python code block
-                code_start = content.find("```python")
-                if code_start == -1:
-                    code_start = content.find("```")
-                code_end = content.find("```", code_start + 3)
-                
-                if code_start != -1 and code_end != -1:
-                    # Extract the code, removing the markdown backticks
-                    if code_start == content.find("```python"):
-                        code = content[code_start + 8:code_end].strip()
-                    else:
-                        code = content[code_start + 3:code_end].strip()
-                    
-                    return await self.save_code(code, filename)
-                    
+                # Extract the first fenced code block
+                match = _CODE_BLOCK_RE.search(content)
+                if match:
+                    return await self.save_code(match.group(1).strip(), filename)
+
         return "No code was found in the assistant's response"
 
     async def save_code(self, code: str, filename: str) -> str:
@@ -161,15 +166,22 @@ async def main():
         }
     ]
     
-    # Process each task
-    for task in tasks:
+    # Run all tasks concurrently; each generation is independent and spends
+    # most of its time waiting on the OpenAI API
+    results = await asyncio.gather(
+        *(app.generate_code(task['description'], task['filename'])
+          for task in tasks),
+        return_exceptions=True
+    )
+
+    # Report each result in order
+    for task, result in zip(tasks, results):
         print(f"\nGenerating code for: {task['description']}")
-        result = await app.generate_code(
-            task['description'],
-            task['filename']
-        )
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
+            continue
         print(result)
-        
+
         # If file was created, verify its size
         file_path = f"output/{task['filename']}"
         if Path(file_path).exists():
@@ -1,7 +1,8 @@
-n
+import math
+
 def factorial(n):
     """
-    Calculate the factorial of a given number recursively.
+    Calculate the factorial of a given number.
 
     Parameters:
     n (int): A non-negative integer for which the factorial is to be calculated.
@@ -18,12 +19,8 @@ def factorial(n):
     if n < 0:
         raise ValueError("Factorial is not defined for negative integers.")
 
-    # Base case: 0! = 1
-    if n == 0:
-        return 1
-
-    # Recursive case: n! = n * (n-1)!
-    return n * factorial(n-1)
+    # math.factorial is implemented in C and has no recursion depth limit
+    return math.factorial(n)
 
 # Example Usage
 if __name__ == "__main__":
@@ -1,4 +1,3 @@
-n
 import string
 import secrets
 
@@ -19,22 +18,25 @@ def generate_secure_password(length=12):
     
     # Define the characters to use in the password
     alphabet = string.ascii_letters + string.digits + string.punctuation
-    
+
     # Ensure the password length is at least 4 to include each character type
     if length < 4:
         raise ValueError("Password length should be at least 4 characters.")
-    
-    # Securely generate a random password
-    password = ''.join(secrets.choice(alphabet) for _ in range(length))
-    
-    # Ensure the password includes at least one of each required character type
-    while (not any(c.islower() for c in password) or
-           not any(c.isupper() for c in password) or
-           not any(c.isdigit() for c in password) or
-           not any(c in string.punctuation for c in password)):
-        password = ''.join(secrets.choice(alphabet) for _ in range(length))
-    
-    return password
+
+    # Guarantee one character from each required class up front, then fill
+    # the remainder from the full alphabet - no retry loop needed
+    password = [
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.digits),
+        secrets.choice(string.punctuation),
+    ]
+    password += [secrets.choice(alphabet) for _ in range(length - 4)]
+
+    # Shuffle so the guaranteed characters are not always at the front
+    secrets.SystemRandom().shuffle(password)
+
+    return ''.join(password)
 
 # Example usage
 if __name__ == "__main__":
@@ -1,11 +1,16 @@
 # assistant.py
 import os
+from pathlib import Path
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Where the cached assistant ID is stored between runs
+ASSISTANT_ID_FILE = Path('.assistant_id')
+
 def initialize_client():
     """
     Initialize the OpenAI client with proper error handling.
@@ -25,7 +30,14 @@ def initialize_client():
         )
     
     try:
-        return OpenAI(api_key=api_key)
+        # Share one pooled HTTP/2 connection across all API calls so
+        # repeated polling doesn't pay a TLS handshake per request
+        http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30.0
+        )
+        return OpenAI(api_key=api_key, http_client=http_client)
     except Exception as e:
         raise Exception(f"Failed to initialize OpenAI client: {str(e)}")
 
@@ -75,4 +87,34 @@ def create_code_assistant(client: OpenAI) -> str:
         )
         return assistant.id
     except Exception as e:
-        raise Exception(f"Failed to create assistant: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to create assistant: {str(e)}")
+
+def get_or_create_assistant(client: OpenAI) -> str:
+    """
+    Returns a reusable assistant ID, creating the assistant only when needed.
+
+    Checks the ASSISTANT_ID environment variable first, then the cached
+    ID file from a previous run. A cached ID is verified with a retrieve
+    call; if it no longer exists, a fresh assistant is created and cached.
+
+    Args:
+        client: Initialized OpenAI client
+
+    Returns:
+        str: The ID of an existing or newly created assistant
+    """
+    assistant_id = os.getenv('ASSISTANT_ID')
+    if not assistant_id and ASSISTANT_ID_FILE.exists():
+        assistant_id = ASSISTANT_ID_FILE.read_text().strip()
+
+    if assistant_id:
+        try:
+            client.beta.assistants.retrieve(assistant_id)
+            return assistant_id
+        except Exception:
+            # Stale or deleted assistant; fall through and recreate it
+            pass
+
+    assistant_id = create_code_assistant(client)
+    ASSISTANT_ID_FILE.write_text(assistant_id)
+    return assistant_id
\ No newline at end of file
@@ -1,12 +1,15 @@
 # security.py
 from pathlib import Path
+import atexit
 import os
 import hashlib
+import queue
 import re
+import threading
+import time
 from typing import List, Optional, Set
 from dataclasses import dataclass
 import logging
-from datetime import datetime
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +18,136 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional multi-pattern matcher: scans all literal patterns in one
+# C-level pass; without it the fused-regex path below is used instead
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# All dangerous patterns except the open() one are plain literals
+_LITERAL_PATTERNS = [
+    ('os.system(', 'Direct system command execution'),
+    ('subprocess.', 'Subprocess execution'),
+    ('eval(', 'Code evaluation'),
+    ('exec(', 'Code execution'),
+    ('__import__(', 'Dynamic imports'),
+    ('requests.', 'Network requests'),
+    ('socket.', 'Socket operations'),
+]
+_OPEN_WRITE_PATTERN = (r'open\(.*,.*w.*\)', 'File write operations')
+_OPEN_WRITE_RE = re.compile(_OPEN_WRITE_PATTERN[0])
+
+# Fallback: the literal patterns fused into a single alternation compiled
+# once at import, so scanning still walks the content exactly once. The
+# open() regex is deliberately kept out of the alternation: finditer is
+# non-overlapping, so its greedy span would swallow literal matches
+# inside it. Both scan paths run it as a separate search instead.
+_DANGER_RE = re.compile(
+    '|'.join(f'(?P<p{i}>{re.escape(literal)})'
+             for i, (literal, _) in enumerate(_LITERAL_PATTERNS))
+)
+# Every pattern requires one of these literals, so content containing
+# none of them cannot match and can skip the scan entirely
+_DANGER_LITERALS = tuple(
+    literal for literal, _ in _LITERAL_PATTERNS
+) + ('open(',)
+
+if ahocorasick is not None:
+    _DANGER_AUTOMATON = ahocorasick.Automaton()
+    for _literal, _description in _LITERAL_PATTERNS:
+        _DANGER_AUTOMATON.add_word(_literal, (_literal, _description))
+    _DANGER_AUTOMATON.make_automaton()
+else:
+    _DANGER_AUTOMATON = None
+
+class _AuditLogWriter(threading.Thread):
+    """
+    Background thread that appends audit log entries in batches.
+
+    Callers enqueue formatted lines and return immediately; the thread
+    drains everything queued since its last write and appends it with a
+    single write + fsync, so logging never blocks the event loop and
+    the per-entry file overhead is amortized across each batch.
+    """
+
+    def __init__(self, log_path: str = 'security_audit.log'):
+        super().__init__(name='audit-log-writer', daemon=True)
+        self._log_path = log_path
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.start()
+        atexit.register(self.flush)
+
+    def write(self, line: str) -> None:
+        """Queues a single log line for appending."""
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        """Drains and writes any queued entries (called at interpreter exit)."""
+        lines = self._drain()
+        if lines:
+            self._append(lines)
+
+    # Seconds to wait before retrying after a failed append
+    _RETRY_DELAY = 1.0
+
+    def run(self) -> None:
+        # Entries that failed to write are kept in order and retried, so a
+        # transient error (disk full, permission change) pauses auditing
+        # instead of killing the thread and silently dropping the trail
+        pending: List[str] = []
+        while True:
+            if not pending:
+                pending.append(self._queue.get())
+            pending.extend(self._drain())
+            try:
+                self._append(pending)
+            except OSError as e:
+                logger.error(f"Audit log write failed, will retry: {e}")
+                time.sleep(self._RETRY_DELAY)
+            else:
+                pending = []
+
+    def _drain(self) -> List[str]:
+        lines = []
+        try:
+            while True:
+                lines.append(self._queue.get_nowait())
+        except queue.Empty:
+            return lines
+
+    def _append(self, lines: List[str]) -> None:
+        with open(self._log_path, 'a') as f:
+            f.write(''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+
+_audit_writer: Optional[_AuditLogWriter] = None
+_audit_writer_lock = threading.Lock()
+
+# Timestamp cache: audit entries only need 1-second granularity, so the
+# formatted string is reused until the clock ticks over
+_last_timestamp_sec = 0
+_last_timestamp_str = ''
+
+def _timestamp() -> str:
+    """Returns the current time as YYYY-MM-DDTHH:MM:SS, cached per second."""
+    global _last_timestamp_sec, _last_timestamp_str
+    sec = int(time.time())
+    if sec != _last_timestamp_sec:
+        _last_timestamp_str = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        _last_timestamp_sec = sec
+    return _last_timestamp_str
+
+def _get_audit_writer() -> _AuditLogWriter:
+    """Returns the shared audit log writer, starting it on first use."""
+    global _audit_writer
+    if _audit_writer is None:
+        with _audit_writer_lock:
+            if _audit_writer is None:
+                _audit_writer = _AuditLogWriter()
+    return _audit_writer
+
 @dataclass
 class SecurityConfig:
     """Configuration class for security settings"""
@@ -36,6 +169,12 @@ class SecurityValidator:
             config: Optional SecurityConfig object with custom settings
         """
         self.config = config or SecurityConfig()
+        # Resolve the allowed directories once; path validation then
+        # reduces to a containment check against these roots
+        self._allowed_roots = [
+            Path(allowed_dir).resolve()
+            for allowed_dir in self.config.allowed_directories
+        ]
         self._setup_audit_log()
     
     def _setup_audit_log(self) -> None:
@@ -53,41 +192,35 @@ class SecurityValidator:
             event_type: Type of security event (e.g., 'FILE_ACCESS', 'VALIDATION_FAIL')
             details: Detailed description of the event
         """
-        timestamp = datetime.now().isoformat()
-        with open('security_audit.log', 'a') as f:
-            f.write(f"{timestamp} - {event_type} - {details}\n")
+        _get_audit_writer().write(f"{_timestamp()} - {event_type} - {details}\n")
         logger.info(f"Security event logged: {event_type}")
 
     def validate_file_path(self, file_path: str) -> bool:
         """
         Validates if a file path is secure for operations.
-        
+
+        The path is canonicalized with a single resolve() call, which
+        catches '..' segments and symlink escapes in one step, then checked
+        for an allowed extension and containment in an allowed directory.
+
         Args:
             file_path: Path to validate
-            
+
         Returns:
             bool: True if path is secure, False otherwise
-            
-        Raises:
-            ValueError: If path contains suspicious patterns
         """
-        path = Path(file_path)
-        
-        # Check for directory traversal attempts
-        if '..' in path.parts:
-            self.log_security_event('VALIDATION_FAIL', f'Directory traversal attempt: {file_path}')
-            raise ValueError("Directory traversal not allowed")
-        
+        path = Path(file_path).resolve()
+
         # Validate file extension
         if path.suffix not in self.config.allowed_file_types:
             self.log_security_event('VALIDATION_FAIL', f'Invalid file type: {path.suffix}')
             return False
-        
-        # Validate parent directory
-        if not any(allowed_dir in str(path.parent) for allowed_dir in self.config.allowed_directories):
+
+        # The canonical path must live under one of the allowed roots
+        if not any(path.is_relative_to(root) for root in self._allowed_roots):
             self.log_security_event('VALIDATION_FAIL', f'Invalid directory: {path.parent}')
             return False
-            
+
         return True
     
     def scan_file_content(self, content: str) -> List[str]:
@@ -101,24 +234,41 @@ class SecurityValidator:
             List of identified security concerns
         """
         concerns = []
-        
-        # Patterns to check for
-        dangerous_patterns = {
-            r'os\.system\(': 'Direct system command execution',
-            r'subprocess\.': 'Subprocess execution',
-            r'eval\(': 'Code evaluation',
-            r'exec\(': 'Code execution',
-            r'__import__\(': 'Dynamic imports',
-            r'open\(.*,.*w.*\)': 'File write operations',
-            r'requests\.': 'Network requests',
-            r'socket\.': 'Socket operations'
-        }
-        
-        for pattern, description in dangerous_patterns.items():
-            if re.search(pattern, content):
+
+        # Fast path: clean content contains none of the trigger literals
+        if not any(literal in content for literal in _DANGER_LITERALS):
+            return concerns
+
+        # One pass over the content for the literal patterns, each
+        # reported at most once
+        seen = set()
+        if _DANGER_AUTOMATON is not None:
+            for _, (literal, description) in _DANGER_AUTOMATON.iter(content):
+                if literal in seen:
+                    continue
+                seen.add(literal)
+                concerns.append(f"Found potentially dangerous pattern: {description}")
+                self.log_security_event('CONTENT_SCAN', f'Found pattern: {literal}')
+        else:
+            for match in _DANGER_RE.finditer(content):
+                index = int(match.lastgroup[1:])
+                literal, description = _LITERAL_PATTERNS[index]
+                if literal in seen:
+                    continue
+                seen.add(literal)
                 concerns.append(f"Found potentially dangerous pattern: {description}")
-                self.log_security_event('CONTENT_SCAN', f'Found pattern: {pattern}')
-                
+                self.log_security_event('CONTENT_SCAN', f'Found pattern: {literal}')
+
+        # The open() write check needs a real regex, and only runs when
+        # its trigger literal is present
+        if 'open(' in content and _OPEN_WRITE_RE.search(content):
+            concerns.append(
+                f"Found potentially dangerous pattern: {_OPEN_WRITE_PATTERN[1]}"
+            )
+            self.log_security_event(
+                'CONTENT_SCAN', f'Found pattern: {_OPEN_WRITE_PATTERN[0]}'
+            )
+
         return concerns
     
     def compute_file_hash(self, file_path: str) -> str:
@@ -131,17 +281,11 @@ class SecurityValidator:
         Returns:
             str: Hex digest of file hash
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-            
-        sha256_hash = hashlib.sha256()
-        
+        # file_digest runs the read/update loop in C with a large buffer,
+        # avoiding per-chunk Python overhead; open itself raises
+        # FileNotFoundError, so no separate existence check is needed
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-                
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
     
     def verify_file_size(self, file_path: str) -> bool:
         """
@@ -153,15 +297,16 @@ class SecurityValidator:
         Returns:
             bool: True if file size is acceptable
         """
-        path = Path(file_path)
-        if not path.exists():
+        # Single stat call covers both the existence and size checks
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             return True
-            
-        file_size = path.stat().st_size
+
         if file_size > self.config.max_file_size:
             self.log_security_event('SIZE_LIMIT', f'File exceeds size limit: {file_path}')
             return False
-            
+
         return True
 
 def create_security_context(custom_config: Optional[SecurityConfig] = None) -> SecurityValidator:
@@ -7,9 +7,13 @@ import asyncio
 from contextlib import asynccontextmanager
 import subprocess
 import shlex
-from typing import Dict
+import sys
+import uuid
+from typing import Dict, Optional
 import asyncio
 
+from . import uring_writer
+
 class SecurityError(Exception):
     """Raised when a security check fails"""
     pass
@@ -18,38 +22,92 @@ class SecurityError(Exception):
 async def safe_file_write(file_path: str):
     """
     Context manager for safely writing to files.
-    Implements proper locking and cleanup.
-    
+
+    Runs the security checks up front; the write itself is already
+    atomic, so no lock file is needed.
+
     Args:
         file_path: Path where the file should be written
-        
+
     Yields:
         Path object for the file
-        
+
     Raises:
         SecurityError: If security checks fail
     """
     path = Path(file_path)
-    
+
     # Security checks
     if not path.suffix in {'.py', '.js', '.ts', '.txt'}:
         raise SecurityError(f"Unsupported file type: {path.suffix}")
-        
+
     if not path.parent.exists():
         raise SecurityError(f"Directory does not exist: {path.parent}")
-        
-    try:
-        # Create a lock file to prevent concurrent writes
-        lock_path = path.with_suffix(path.suffix + '.lock')
-        with open(lock_path, 'w') as f:
-            f.write(str(os.getpid()))
-            
-        yield path
-        
-    finally:
-        # Cleanup: Always remove the lock file
-        if lock_path.exists():
-            lock_path.unlink()
+
+    yield path
+
+# Written files get the same permissions on every platform and branch
+_FILE_MODE = 0o644
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Writes data to fd in full, retrying on short writes."""
+    engine = uring_writer.get_engine()
+    offset = 0
+    while offset < len(data):
+        chunk = data[offset:]
+        # Route through the shared io_uring engine when available so
+        # concurrent writes are submitted to the kernel as one batch;
+        # the engine uses pwrite semantics, so pass the running offset
+        if engine is not None:
+            offset += engine.write(fd, chunk, offset)
+        else:
+            offset += os.write(fd, chunk)
+
+def _atomic_write(path: Path, content: str) -> None:
+    """
+    Writes content to a file atomically.
+    Runs in a worker thread so the event loop is never blocked on disk I/O.
+
+    On Linux the file is written through an anonymous O_TMPFILE descriptor
+    and linked into place, so no temp path ever appears in the directory
+    and there is nothing to clean up on failure. Elsewhere (or on
+    filesystems without O_TMPFILE support) it falls back to the classic
+    visible-temp-file-then-replace dance.
+    """
+    if hasattr(os, 'O_TMPFILE'):
+        try:
+            fd = os.open(str(path.parent), os.O_TMPFILE | os.O_WRONLY, _FILE_MODE)
+        except OSError:
+            pass  # filesystem doesn't support O_TMPFILE
+        else:
+            try:
+                # fchmod overrides the umask so both branches produce the
+                # same permissions
+                os.fchmod(fd, _FILE_MODE)
+                _write_all(fd, content.encode())
+                try:
+                    os.link(f'/proc/self/fd/{fd}', path)
+                    return
+                except FileExistsError:
+                    # link() won't overwrite; give the anonymous file a
+                    # unique name and atomically replace the target
+                    temp_path = path.with_suffix(f'{path.suffix}.{os.getpid()}.tmp')
+                    try:
+                        os.link(f'/proc/self/fd/{fd}', temp_path)
+                    except OSError:
+                        pass  # /proc linking unavailable; fallback below
+                    else:
+                        os.replace(temp_path, path)
+                        return
+                except OSError:
+                    pass  # /proc linking unavailable; use the fallback below
+            finally:
+                os.close(fd)
+
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    temp_path.write_text(content)
+    os.chmod(temp_path, _FILE_MODE)
+    temp_path.replace(path)
 
 async def file_writer(arguments: Dict[str, str]) -> Dict[str, str]:
     """
@@ -68,13 +126,9 @@ async def file_writer(arguments: Dict[str, str]) -> Dict[str, str]:
     
     try:
         async with safe_file_write(file_path) as path:
-            # Write with atomic operations
-            temp_path = path.with_suffix(path.suffix + '.tmp')
-            with open(temp_path, 'w') as f:
-                f.write(content)
-            # Atomic replace
-            temp_path.replace(path)
-            
+            # Write atomically, off the event loop
+            await asyncio.to_thread(_atomic_write, path, content)
+
         return {
             "status": "success",
             "message": f"Code written to {file_path}"
@@ -96,6 +150,188 @@ class ExecutionError(Exception):
     """Raised when code execution fails"""
     pass
 
+# Loop run inside each pooled worker: read a per-run sentinel token and a
+# script path per line, run the script, then echo the token back on its
+# own status line so the parent knows the run is done. The token is
+# random for every run, so the executed (untrusted) script cannot forge
+# the end-of-run marker. The leading newline terminates any unterminated
+# final line of script output so the status always starts its own line;
+# the parent strips the extra newline again.
+_WORKER_SOURCE = """\
+import sys, runpy, traceback
+for line in sys.stdin:
+    token, _, path = line.rstrip('\\n').partition(' ')
+    if not path:
+        continue
+    status = 'ok'
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status = 'err'
+    except BaseException:
+        traceback.print_exc()
+        status = 'err'
+    print('\\n' + token + ' ' + status, flush=True)
+"""
+
+class _WorkerPool:
+    """
+    Pool of warm Python interpreter subprocesses for repeated script runs.
+
+    Spawning a fresh interpreter costs 50-150ms of startup per execution;
+    the pool amortizes that by keeping a few interpreters alive and feeding
+    them script paths over stdin. Workers merge stderr into stdout and mark
+    the end of each run with a status line carrying a random per-run
+    token. A worker that times out or dies is killed and replaced on the
+    next checkout.
+    """
+
+    def __init__(self, size: int = 2):
+        self._size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._spawned = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Drops all workers after an event loop switch.
+
+        Idle workers hold stream transports bound to the loop that spawned
+        them, so after e.g. a second asyncio.run() in the same process they
+        would fail with cross-loop errors. Kill them and start fresh,
+        including the queue, whose waiters are also loop-bound.
+        """
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is None or worker.returncode is not None:
+                continue
+            try:
+                worker.kill()
+            except Exception:
+                pass  # transport already torn down with its loop
+        self._idle = asyncio.Queue()
+        self._spawned = 0
+        self._loop = loop
+
+    async def _acquire(self) -> asyncio.subprocess.Process:
+        """
+        Returns an idle worker, spawning a fresh one when a slot is free.
+
+        None entries in the idle queue are restart tokens left by _discard;
+        they wake one waiter so it can claim the freed slot instead of
+        blocking on a worker that no longer exists.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset(loop)
+        while True:
+            if not self._idle.empty():
+                worker = self._idle.get_nowait()
+            elif self._spawned < self._size:
+                worker = None
+            else:
+                worker = await self._idle.get()
+            if worker is None:
+                # Freed slot or restart token; re-check the limit in case
+                # another caller claimed the slot first
+                if self._spawned < self._size:
+                    return await self._spawn()
+                continue
+            if worker.returncode is None:
+                return worker
+            # Worker died while idle; release its slot and look again
+            self._spawned -= 1
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        self._spawned += 1
+        try:
+            return await asyncio.create_subprocess_exec(
+                sys.executable, '-u', '-c', _WORKER_SOURCE,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+        except BaseException:
+            self._spawned -= 1
+            raise
+
+    def _discard(self, worker: asyncio.subprocess.Process) -> None:
+        """Kills a broken worker and wakes a waiter to take over its slot."""
+        if worker.returncode is None:
+            worker.kill()
+        self._spawned -= 1
+        self._idle.put_nowait(None)
+
+    async def run(self, script_path: str, timeout: float) -> Dict[str, str]:
+        """
+        Runs a Python script on a pooled worker.
+
+        Args:
+            script_path: Path of the script to execute
+            timeout: Maximum seconds to wait for completion
+
+        Returns:
+            Dict containing execution status and output
+
+        Raises:
+            ExecutionError: On script failure, timeout, or worker death
+        """
+        # The clock starts before acquisition so waiting for a free worker
+        # counts against the timeout too
+        deadline = asyncio.get_running_loop().time() + timeout
+        try:
+            worker = await asyncio.wait_for(self._acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise ExecutionError("Execution timed out")
+        # Fresh random token per run; the worker echoes it back on the
+        # status line, so script output cannot spoof end-of-run
+        token = uuid.uuid4().hex
+        sentinel = token + ' '
+        output_lines = []
+        try:
+            worker.stdin.write(f"{token} {script_path}\n".encode())
+            await worker.stdin.drain()
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                line = await asyncio.wait_for(
+                    worker.stdout.readline(),
+                    timeout=remaining
+                )
+                if not line:
+                    raise ExecutionError("Worker process exited unexpectedly")
+                text = line.decode()
+                if text.startswith(sentinel):
+                    status = text[len(sentinel):].strip()
+                    break
+                output_lines.append(text)
+        except asyncio.TimeoutError:
+            self._discard(worker)
+            raise ExecutionError("Execution timed out")
+        except Exception:
+            self._discard(worker)
+            raise
+        else:
+            # Worker is clean and ready for the next script
+            self._idle.put_nowait(worker)
+
+        # Drop the newline the worker injected before the status line
+        output = ''.join(output_lines)
+        if output.endswith('\n'):
+            output = output[:-1]
+        if status != 'ok':
+            raise ExecutionError(f"Process failed: {output}")
+
+        return {
+            "status": "success",
+            "output": output,
+            "stderr": ""
+        }
+
+_python_pool = _WorkerPool()
+
 async def file_executor(arguments: Dict[str, str]) -> Dict[str, str]:
     """
     Executes a file with the specified command in a controlled environment.
@@ -128,6 +364,12 @@ async def file_executor(arguments: Dict[str, str]) -> Dict[str, str]:
     }
     
     try:
+        # Plain "python script.py" runs go to the warm worker pool, which
+        # amortizes interpreter startup across calls; anything else falls
+        # back to a one-shot subprocess
+        if len(cmd_parts) == 2 and Path(cmd_parts[0]).name.startswith('python'):
+            return await _python_pool.run(cmd_parts[1], limits['timeout'])
+
         # Run in subprocess with resource limits
         process = await asyncio.create_subprocess_exec(
             *cmd_parts,